@@ -3,14 +3,88 @@ API Client wrapper around Playwright's async request functionality.
 Provides a clean, easy-to-use interface for API testing with configuration support.
 """
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from playwright.async_api import async_playwright, APIResponse
+import asyncio
+import hashlib
 import json
 import logging
+import os
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional: orjson's C encoder/decoder is several times faster than stdlib json
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Sentinel for "not fetched yet" so cached values of None/empty are still valid
+_MISSING = object()
+
+# Dict bodies with at least this many top-level items are serialized in a
+# worker thread so the event loop stays free for other in-flight requests
+_EXECUTOR_BODY_ITEMS = 256
+
+# Shared default Config - built once, reused by every client constructed
+# without a config_file (clients copy the headers they need, so sharing is safe)
+_default_config = None
+
+
+def _get_default_config() -> Config:
+    global _default_config
+    if _default_config is None:
+        _default_config = Config()
+    return _default_config
+
+
+# Last level applied to the framework logger, so repeated client
+# constructions with an unchanged config skip the logging call entirely
+_configured_log_level = None
+
+
+def _load_cassette(path: str) -> Optional['ReplayedResponse']:
+    """Load a recorded response from disk, or None if there's no cassette."""
+    try:
+        with open(path, 'r') as file:
+            saved = json.load(file)
+    except OSError:
+        return None
+    return ReplayedResponse(saved['status'], saved['status_text'],
+                            saved['headers'], saved['body'])
+
+
+async def _save_cassette(path: str, response: 'APIResponseWrapper'):
+    """Record a response to disk so later runs can replay it."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump({
+            'status': response.status,
+            'status_text': response.status_text,
+            'headers': response.headers,
+            'body': await response.text(),
+        }, file)
+
+
+def configure_logging(level: int):
+    """
+    Set the log level on the framework's own logger.
+
+    Only touches the 'framework' logger hierarchy (not the root logger), so
+    applications embedding the client keep their own logging configuration.
+    """
+    global _configured_log_level
+    if level != _configured_log_level:
+        logging.getLogger("framework").setLevel(level)
+        _configured_log_level = level
+
 
 class APIClient:
     """
@@ -19,7 +93,9 @@ class APIClient:
     """
 
     def __init__(self, base_url: str = "", headers: Optional[Dict[str, str]] = None,
-                 config_file: Optional[str] = None):
+                 config_file: Optional[str] = None, config: Optional[Config] = None,
+                 playwright=None, cache_gets: bool = False,
+                 cassette_dir: Optional[str] = None, record_mode: str = "once"):
         """
         Initialize the API client.
 
@@ -27,31 +103,75 @@ class APIClient:
             base_url: Base URL for all requests (overrides config)
             headers: Default headers (merged with config headers)
             config_file: Path to YAML configuration file
+            config: Already-built Config to reuse (takes precedence over
+                config_file); lets callers load a config once and share it
+                across many clients
+            playwright: Already-started Playwright instance to reuse. Starting
+                Playwright spawns a driver subprocess, so sharing one instance
+                across many clients (e.g. via a session-scoped fixture) avoids
+                paying that cost per client.
+            cache_gets: Cache successful GET responses in memory, keyed by URL,
+                params and headers. Useful against deterministic test APIs
+                where repeated identical GETs would only re-fetch the same
+                body; leave off when responses can change during the run.
+            cassette_dir: Directory of recorded GET responses. When set, GETs
+                are replayed from disk instead of hitting the network, which
+                makes repeat runs fast and deterministic even offline. Only
+                status/headers/body are stored - never request headers, so
+                credentials stay out of the cassettes.
+            record_mode: With cassette_dir set: 'once' records a cassette on
+                the first miss and replays it afterwards; 'none' never records
+                and raises on a miss (useful in CI to guarantee offline runs).
         """
         # Load configuration
-        if config_file:
+        if config is not None:
+            self.config = config
+        elif config_file:
             self.config = Config(config_file)
         else:
-            self.config = Config()  # Use defaults
+            self.config = _get_default_config()  # Shared defaults
 
         # Override config with constructor parameters
         self.base_url = base_url or self.config.base_url
         self.base_url = self.base_url.rstrip('/')  # Remove trailing slash
+        # Precomputed so _build_url doesn't re-join base_url per request
+        self._base_prefix = self.base_url + "/" if self.base_url else ""
 
         # Merge headers: config headers + constructor headers
         self.default_headers = self.config.default_headers.copy()
         if headers:
             self.default_headers.update(headers)
 
-        # Set up logging level
-        logging.getLogger().setLevel(getattr(logging, self.config.log_level))
+        # Prebuilt for the common "dict body, no per-request headers" case in
+        # post/put, so the JSON content type doesn't cost a merge per request
+        if 'Content-Type' in self.default_headers:
+            self._json_default_headers = self.default_headers
+        else:
+            self._json_default_headers = {**self.default_headers,
+                                          'Content-Type': 'application/json'}
+
+        # Playwright takes per-request timeouts in milliseconds
+        self._timeout_ms = self.config.timeout * 1000
+
+        # Set up logging level (no-op when the level hasn't changed)
+        configure_logging(self.config.log_level_num)
+
+        self.cache_gets = cache_gets
+        self._get_cache: Dict[tuple, 'APIResponseWrapper'] = {}
 
-        self._playwright = None
+        if record_mode not in ('once', 'none'):
+            raise ValueError(f"Invalid record_mode: {record_mode}")
+        self.cassette_dir = cassette_dir
+        self.record_mode = record_mode
+
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
         self._request_context = None
 
     async def __aenter__(self):
         """Async context manager entry - sets up Playwright"""
-        self._playwright = await async_playwright().start()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
         # For API testing, we don't need a browser - just use the request context directly
         self._request_context = await self._playwright.request.new_context(
             base_url=self.base_url,
@@ -63,22 +183,41 @@ class APIClient:
         """Async context manager exit - cleans up Playwright"""
         if self._request_context:
             await self._request_context.dispose()
-        if self._playwright:
+        # Only stop Playwright if we started it; a shared instance belongs to the caller
+        if self._playwright and self._owns_playwright:
             await self._playwright.stop()
+            self._playwright = None
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from base_url and endpoint"""
-        if endpoint.startswith('http'):
+        if endpoint[:4] == 'http':
             return endpoint  # Full URL provided
-        endpoint = endpoint.lstrip('/')  # Remove leading slash
-        return f"{self.base_url}/{endpoint}" if self.base_url else endpoint
+        if endpoint[:1] == '/':
+            # Slice off the single leading slash - cheaper than lstrip, which
+            # scans and reallocates even when there's nothing to strip
+            endpoint = endpoint[1:]
+        return self._base_prefix + endpoint
+
+    @staticmethod
+    async def _serialize_body(data: Dict) -> str:
+        """
+        Serialize a dict request body to JSON.
+
+        Small payloads are encoded inline; large ones are handed to a worker
+        thread so serialization doesn't block other tasks on the event loop.
+        """
+        if len(data) >= _EXECUTOR_BODY_ITEMS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _dumps, data)
+        return _dumps(data)
 
     def _merge_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
         """Merge default headers with request-specific headers"""
-        merged = self.default_headers.copy()
-        if headers:
-            merged.update(headers)
-        return merged
+        if not headers:
+            # Nothing to merge - Playwright only reads the mapping, so the
+            # defaults can be handed over without a per-request copy
+            return self.default_headers
+        return {**self.default_headers, **headers}
 
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, str]] = None) -> 'APIResponseWrapper':
@@ -96,15 +235,66 @@ class APIClient:
         url = self._build_url(endpoint)
         merged_headers = self._merge_headers(headers)
 
-        logger.info(f"GET {url}")
+        if self.cache_gets:
+            cache_key = (url,
+                         tuple(sorted(params.items())) if params else (),
+                         tuple(sorted(headers.items())) if headers else ())
+            cached = self._get_cache.get(cache_key)
+            if cached is not None:
+                logger.info("GET %s (cached)", url)
+                return cached
+
+        if self.cassette_dir:
+            cassette = self._cassette_path('GET', url, params)
+            replayed = _load_cassette(cassette)
+            if replayed is not None:
+                logger.info("GET %s (cassette)", url)
+                return replayed
+            if self.record_mode == 'none':
+                raise ValueError(
+                    f"No cassette recorded for GET {url} and record_mode='none'")
+
+        logger.info("GET %s", url)
         response = await self._request_context.get(
             url,
             params=params,
-            headers=merged_headers
+            headers=merged_headers,
+            timeout=self._timeout_ms
         )
 
-        logger.info(f"Response: {response.status} {response.status_text}")
-        return APIResponseWrapper(response)
+        logger.info("Response: %s %s", response.status, response.status_text)
+        wrapper = APIResponseWrapper(response)
+        if (self.cache_gets and wrapper.is_successful()
+                and 'no-store' not in response.headers.get('cache-control', '')):
+            self._get_cache[cache_key] = wrapper
+        if self.cassette_dir:
+            await _save_cassette(cassette, wrapper)
+        return wrapper
+
+    def _cassette_path(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Path of the cassette file for a request, hashed from its key."""
+        key = f"{method} {url} {sorted(params.items()) if params else ''}"
+        name = hashlib.sha1(key.encode()).hexdigest() + '.json'
+        return os.path.join(self.cassette_dir, name)
+
+    async def get_many(self, endpoints: List[str],
+                       headers: Optional[Dict[str, str]] = None) -> List['APIResponseWrapper']:
+        """
+        Make several GET requests concurrently.
+
+        Since the request context is async, firing the requests together costs
+        roughly one round-trip instead of one per endpoint.
+
+        Args:
+            endpoints: List of API endpoints (e.g., ['/posts/1', '/posts/2'])
+            headers: Additional headers applied to every request
+
+        Returns:
+            List of APIResponseWrapper objects, in the same order as endpoints
+        """
+        return await asyncio.gather(
+            *(self.get(endpoint, headers=headers) for endpoint in endpoints)
+        )
 
     async def post(self, endpoint: str, data: Optional[Union[Dict, str]] = None,
              headers: Optional[Dict[str, str]] = None) -> 'APIResponseWrapper':
@@ -124,17 +314,21 @@ class APIClient:
 
         # Handle JSON data
         if isinstance(data, dict):
-            data = json.dumps(data)
-            merged_headers.setdefault('Content-Type', 'application/json')
+            data = await self._serialize_body(data)
+            if not headers:
+                merged_headers = self._json_default_headers
+            elif 'Content-Type' not in merged_headers:
+                merged_headers = {**merged_headers, 'Content-Type': 'application/json'}
 
-        logger.info(f"POST {url}")
+        logger.info("POST %s", url)
         response = await self._request_context.post(
             url,
             data=data,
-            headers=merged_headers
+            headers=merged_headers,
+            timeout=self._timeout_ms
         )
 
-        logger.info(f"Response: {response.status} {response.status_text}")
+        logger.info("Response: %s %s", response.status, response.status_text)
         return APIResponseWrapper(response)
 
     async def put(self, endpoint: str, data: Optional[Union[Dict, str]] = None,
@@ -144,17 +338,21 @@ class APIClient:
         merged_headers = self._merge_headers(headers)
 
         if isinstance(data, dict):
-            data = json.dumps(data)
-            merged_headers.setdefault('Content-Type', 'application/json')
+            data = await self._serialize_body(data)
+            if not headers:
+                merged_headers = self._json_default_headers
+            elif 'Content-Type' not in merged_headers:
+                merged_headers = {**merged_headers, 'Content-Type': 'application/json'}
 
-        logger.info(f"PUT {url}")
+        logger.info("PUT %s", url)
         response = await self._request_context.put(
             url,
             data=data,
-            headers=merged_headers
+            headers=merged_headers,
+            timeout=self._timeout_ms
         )
 
-        logger.info(f"Response: {response.status} {response.status_text}")
+        logger.info("Response: %s %s", response.status, response.status_text)
         return APIResponseWrapper(response)
 
     async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> 'APIResponseWrapper':
@@ -162,13 +360,14 @@ class APIClient:
         url = self._build_url(endpoint)
         merged_headers = self._merge_headers(headers)
 
-        logger.info(f"DELETE {url}")
+        logger.info("DELETE %s", url)
         response = await self._request_context.delete(
             url,
-            headers=merged_headers
+            headers=merged_headers,
+            timeout=self._timeout_ms
         )
 
-        logger.info(f"Response: {response.status} {response.status_text}")
+        logger.info("Response: %s %s", response.status, response.status_text)
         return APIResponseWrapper(response)
 
 
@@ -178,40 +377,124 @@ class APIResponseWrapper:
     Makes it easier to work with API responses in tests.
     """
 
+    # One wrapper is created per request; slots keep them small and make
+    # attribute access a fixed-offset read instead of a dict lookup
+    __slots__ = ('_response', '_status', '_status_text', '_headers',
+                 '_status_class', '_json_cache', '_text_cache')
+
     def __init__(self, response: APIResponse):
         self._response = response
+        # Pull these through the Playwright proxy once; the properties below
+        # then return plain cached values instead of repeating the hop
+        self._status = response.status
+        self._status_text = response.status_text
+        self._headers = response.headers
+        self._status_class = self._status // 100
+        self._json_cache = _MISSING
+        self._text_cache = _MISSING
+
+    @property
+    def status(self) -> int:
+        """HTTP status code"""
+        return self._status
+
+    @property
+    def status_text(self) -> str:
+        """HTTP status text"""
+        return self._status_text
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Response headers"""
+        return self._headers
+
+    async def json(self) -> Dict[str, Any]:
+        """Parse response body as JSON (parsed once, then cached)"""
+        if self._json_cache is _MISSING:
+            # Parse the raw body ourselves so orjson is used when available
+            self._json_cache = _loads(await self._response.body())
+        return self._json_cache
+
+    async def text(self) -> str:
+        """Get response body as text (fetched once, then cached)"""
+        if self._text_cache is _MISSING:
+            self._text_cache = await self._response.text()
+        return self._text_cache
+
+    def invalidate(self):
+        """Drop cached json/text so the next call re-reads the response body"""
+        self._json_cache = _MISSING
+        self._text_cache = _MISSING
+
+    def is_successful(self) -> bool:
+        """Check if status code indicates success (200-299)"""
+        return self._status_class == 2
+
+    def is_client_error(self) -> bool:
+        """Check if status code indicates client error (400-499)"""
+        return self._status_class == 4
+
+    def is_server_error(self) -> bool:
+        """Check if status code indicates server error (500-599)"""
+        return self._status_class == 5
+
+
+class ReplayedResponse:
+    """
+    Response served from a cassette instead of the network.
+
+    Exposes the same public API as APIResponseWrapper, so tests work the same
+    whether a response was recorded or live.
+    """
+
+    __slots__ = ('_status', '_status_text', '_headers', '_status_class',
+                 '_body', '_json_cache')
+
+    def __init__(self, status: int, status_text: str, headers: Dict[str, str], body: str):
+        self._status = status
+        self._status_text = status_text
+        self._headers = headers
+        self._status_class = status // 100
+        self._body = body
+        self._json_cache = _MISSING
 
     @property
     def status(self) -> int:
         """HTTP status code"""
-        return self._response.status
+        return self._status
 
     @property
     def status_text(self) -> str:
         """HTTP status text"""
-        return self._response.status_text
+        return self._status_text
 
     @property
     def headers(self) -> Dict[str, str]:
         """Response headers"""
-        return self._response.headers
+        return self._headers
 
     async def json(self) -> Dict[str, Any]:
-        """Parse response body as JSON"""
-        return await self._response.json()
+        """Parse response body as JSON (parsed once, then cached)"""
+        if self._json_cache is _MISSING:
+            self._json_cache = _loads(self._body)
+        return self._json_cache
 
     async def text(self) -> str:
         """Get response body as text"""
-        return await self._response.text()
+        return self._body
+
+    def invalidate(self):
+        """Drop the cached json so the next call re-parses the body"""
+        self._json_cache = _MISSING
 
     def is_successful(self) -> bool:
         """Check if status code indicates success (200-299)"""
-        return 200 <= self.status < 300
+        return self._status_class == 2
 
     def is_client_error(self) -> bool:
         """Check if status code indicates client error (400-499)"""
-        return 400 <= self.status < 500
+        return self._status_class == 4
 
     def is_server_error(self) -> bool:
         """Check if status code indicates server error (500-599)"""
-        return 500 <= self.status < 600
\ No newline at end of file
+        return self._status_class == 5
\ No newline at end of file
@@ -3,10 +3,73 @@ Configuration management for the API testing framework.
 Loads settings from YAML files and environment variables.
 """
 
+import json
+import logging
 import os
 import yaml
 from typing import Dict, Any, Optional
 
+try:
+    # libyaml C parser - much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # Python 3.11+; C-backed TOML parser, faster than YAML for config files
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# Parsed YAML keyed by (absolute path, mtime_ns) so repeated Config
+# constructions against the same unchanged file skip the parse entirely
+_CONFIG_CACHE: Dict[tuple, Any] = {}
+
+
+# Suffix of the on-disk JSON cache written next to parsed YAML configs
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _read_config_file(config_file: str) -> Any:
+    """Read and parse a config file (YAML or TOML), caching by path + mtime."""
+    abspath = os.path.abspath(config_file)
+    mtime_ns = os.stat(abspath).st_mtime_ns
+    key = (abspath, mtime_ns)
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = _parse_config_file(abspath, mtime_ns)
+    return _CONFIG_CACHE[key]
+
+
+def _parse_config_file(abspath: str, mtime_ns: int) -> Any:
+    """Parse a config file, going through the JSON sidecar cache for YAML."""
+    if abspath.endswith('.toml'):
+        if tomllib is None:
+            raise ValueError(
+                f"TOML config files require Python 3.11+: {abspath}")
+        with open(abspath, 'rb') as file:
+            return tomllib.load(file)
+
+    # JSON parses an order of magnitude faster than YAML, so new processes
+    # can reuse a sidecar written by an earlier run while the YAML is unchanged
+    sidecar = abspath + _SIDECAR_SUFFIX
+    try:
+        with open(sidecar, 'r') as file:
+            cached = json.load(file)
+        if cached.get('_mtime_ns') == mtime_ns:
+            return cached['data']
+    except (OSError, ValueError):
+        pass  # Missing or stale/corrupt sidecar - fall through to the parse
+
+    with open(abspath, 'r') as file:
+        data = yaml.load(file, Loader=_YamlLoader)
+
+    try:
+        with open(sidecar, 'w') as file:
+            json.dump({'_mtime_ns': mtime_ns, 'data': data}, file)
+    except (OSError, TypeError):
+        pass  # Unwritable directory or non-JSON values - just skip the cache
+    return data
+
 
 class Config:
     """
@@ -14,19 +77,27 @@ class Config:
     and environment variables.
     """
 
+    # Plain data holder built once per client; slots keep instances small
+    # and make attribute reads a fixed-offset lookup
+    __slots__ = ('base_url', 'timeout', '_headers', 'retry_count',
+                 'log_level', 'log_level_num')
+
+    # Immutable header defaults shared by every instance; the per-instance
+    # dict is only materialized when something actually reads or updates it
+    _DEFAULT_HEADERS = (("User-Agent", "Playwright-Test-Framework/1.0"),)
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration.
 
         Args:
-            config_file: Path to YAML config file (e.g., 'config.yaml')
+            config_file: Path to YAML or TOML config file
+                (e.g., 'config.yaml' or 'config.toml'; TOML needs Python 3.11+)
         """
         # Set defaults
         self.base_url = ""
         self.timeout = 30
-        self.default_headers = {
-            "User-Agent": "Playwright-Test-Framework/1.0"
-        }
+        self._headers = None  # Built lazily from _DEFAULT_HEADERS
         self.retry_count = 3
         self.log_level = "INFO"
 
@@ -37,11 +108,21 @@ class Config:
         # Override with environment variables if present
         self._load_from_environment()
 
+        # Resolve the level name to its numeric value once, so clients don't
+        # do a getattr(logging, ...) lookup per construction
+        self.log_level_num = logging._nameToLevel.get(self.log_level, logging.INFO)
+
+    @property
+    def default_headers(self) -> Dict[str, str]:
+        """Default request headers (dict materialized on first access)."""
+        if self._headers is None:
+            self._headers = dict(Config._DEFAULT_HEADERS)
+        return self._headers
+
     def _load_from_yaml(self, config_file: str):
-        """Load configuration from a YAML file."""
+        """Load configuration from a YAML or TOML file."""
         try:
-            with open(config_file, 'r') as file:
-                data = yaml.safe_load(file)
+            data = _read_config_file(config_file)
 
             if not data:
                 return
@@ -63,11 +144,13 @@ class Config:
 
     def _load_from_environment(self):
         """Load secrets from environment variables."""
-        # Only handle secrets, not configuration
-        if os.getenv('API_KEY'):
-            self.default_headers['Authorization'] = f"Bearer {os.getenv('API_KEY')}"
+        # Only handle secrets, not configuration (single lookup per variable)
+        api_key = os.getenv('API_KEY')
+        if api_key:
+            self.default_headers['Authorization'] = f"Bearer {api_key}"
 
-        if os.getenv('API_SECRET'):
+        api_secret = os.getenv('API_SECRET')
+        if api_secret:
             # Could be used for signing requests, etc.
             pass  # Store as needed for your specific use case
 
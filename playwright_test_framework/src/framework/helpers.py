@@ -5,12 +5,32 @@ Provides reusable validation methods to reduce test code duplication.
 
 from typing import Dict, Any, List, Optional
 
+# Fields every post is expected to carry; frozenset so the membership check
+# below is a single C-level set difference instead of a Python loop
+_POST_FIELDS = frozenset(('id', 'title', 'body', 'userId'))
+
 
 class APIValidations:
     """
     Validation helpers for common API response patterns.
+
+    Each validate_* method has a validate_*_data sibling that takes an
+    already-parsed body, so tests can parse once and run many validations.
     """
 
+    @staticmethod
+    def validate_single_post_data(post: Dict[str, Any], post_id):
+        """
+        Validate that an already-parsed post dict is properly structured.
+
+        Args:
+            post: Parsed post dictionary
+            post_id: Expected post ID
+        """
+        missing = _POST_FIELDS - post.keys()
+        assert not missing, f"Post is missing fields: {missing}"
+        assert post['id'] == post_id
+
     @staticmethod
     async def validate_single_post(response, post_id):
         """
@@ -20,11 +40,7 @@ class APIValidations:
             response: APIResponseWrapper object
             post_id: Expected post ID
         """
-        post = await response.json()
-        assert post['id'] == post_id
-        assert 'title' in post
-        assert 'body' in post
-        assert 'userId' in post
+        APIValidations.validate_single_post_data(await response.json(), post_id)
 
     @staticmethod
     async def validate_post_list(response, min_count=1):
@@ -41,10 +57,20 @@ class APIValidations:
 
         # Check first post has required fields
         if posts:
-            first_post = posts[0]
-            required_fields = ['id', 'title', 'body', 'userId']
-            for field in required_fields:
-                assert field in first_post
+            missing = _POST_FIELDS - posts[0].keys()
+            assert not missing, f"First post is missing fields: {missing}"
+
+    @staticmethod
+    def validate_json_contains_fields_data(data: Dict[str, Any], required_fields: List[str]):
+        """
+        Validate that an already-parsed body contains all required fields.
+
+        Args:
+            data: Parsed response dictionary
+            required_fields: List of field names that must be present
+        """
+        missing = frozenset(required_fields) - data.keys()
+        assert not missing, f"Required fields {missing} not found in response"
 
     @staticmethod
     async def validate_json_contains_fields(response, required_fields: List[str]):
@@ -55,9 +81,7 @@ class APIValidations:
             response: APIResponseWrapper object
             required_fields: List of field names that must be present
         """
-        data = await response.json()
-        for field in required_fields:
-            assert field in data, f"Required field '{field}' not found in response"
+        APIValidations.validate_json_contains_fields_data(await response.json(), required_fields)
 
     @staticmethod
     async def validate_json_field_value(response, field_name: str, expected_value):
@@ -74,6 +98,53 @@ class APIValidations:
         assert data[field_name] == expected_value, f"Field '{field_name}' has value '{data[field_name]}', expected '{expected_value}'"
 
 
+class Validator:
+    """
+    Batches several assertions against one response's JSON body.
+
+    The body is fetched and parsed on first use and reused by every
+    subsequent assertion, so a cluster of checks costs a single parse:
+
+        v = Validator(response)
+        await v.has_fields('title', 'body')
+        await v.field_eq('title', 'Some title')
+    """
+
+    def __init__(self, response):
+        """
+        Args:
+            response: APIResponseWrapper object
+        """
+        self._response = response
+        self._data = None
+
+    async def _get(self) -> Dict[str, Any]:
+        """Fetch and cache the parsed JSON body."""
+        if self._data is None:
+            self._data = await self._response.json()
+        return self._data
+
+    async def has_fields(self, *fields: str):
+        """Assert that the body contains all given fields."""
+        data = await self._get()
+        missing = frozenset(fields) - data.keys()
+        assert not missing, f"Required fields {missing} not found in response"
+
+    async def field_eq(self, field_name: str, expected_value):
+        """Assert that a field in the body has the expected value."""
+        data = await self._get()
+        assert field_name in data, f"Field '{field_name}' not found in response"
+        assert data[field_name] == expected_value, \
+            f"Field '{field_name}' has value '{data[field_name]}', expected '{expected_value}'"
+
+    async def is_type(self, field_name: str, expected_type: type):
+        """Assert that a field in the body is of the expected type."""
+        data = await self._get()
+        assert field_name in data, f"Field '{field_name}' not found in response"
+        assert isinstance(data[field_name], expected_type), \
+            f"Field '{field_name}' is {type(data[field_name])}, expected {expected_type}"
+
+
 class ResponseValidations:
     """
     Validation helpers for HTTP response properties.
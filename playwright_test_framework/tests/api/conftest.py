@@ -0,0 +1,19 @@
+"""
+Fixtures local to the API test directory.
+"""
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_hosts(api_client):
+    """
+    Fire one request before the first API test runs.
+
+    This moves the one-time costs - Playwright driver spawn, DNS resolution
+    and the TLS handshake to the API host - into session setup, so the first
+    test doesn't absorb them (and timing variance between runs shrinks).
+    With the shared client's GET cache on, the warm-up response is also
+    reused by the tests that read /posts/1.
+    """
+    await api_client.get("/posts/1")
@@ -3,22 +3,58 @@ Example API tests showing how to use the framework with helper validations.
 Uses JSONPlaceholder (a free fake API).
 """
 
+import asyncio
+import json
+
 import pytest
-import pytest_asyncio
-from framework.api_client import APIClient
 from framework.helpers import APIValidations, ResponseValidations
 
+pytestmark = pytest.mark.integration
+
+# Deterministic request payloads - built and JSON-encoded once at import
+# instead of per test run, so the client can send the bytes as-is
+_NEW_POST = {
+    'title': 'Test Framework Post',
+    'body': 'This post was created by our test framework!',
+    'userId': 1
+}
+_NEW_POST_BODY = json.dumps(_NEW_POST)
+
+_UPDATED_POST = {
+    'id': 1,
+    'title': 'Updated Title',
+    'body': 'Updated body content',
+    'userId': 1
+}
+_UPDATED_POST_BODY = json.dumps(_UPDATED_POST)
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_POST_FIELDS = frozenset(('id', 'title', 'body', 'userId'))
+
+# Known post IDs and their paths, formatted once at import rather than
+# per run - the list only has to grow in one place
+_POST_IDS = (1, 2, 3, 4, 5)
+_POST_PATHS = tuple(f"/posts/{post_id}" for post_id in _POST_IDS)
+
+
+def _assert_post_shape(post, expected_id=None):
+    """Assert a parsed post carries the expected fields (and optionally id)."""
+    missing = _POST_FIELDS - post.keys()
+    assert not missing, f"Post is missing fields: {missing}"
+    if expected_id is not None:
+        assert post['id'] == expected_id
+
 
 class TestJSONPlaceholderAPI:
-    """Example test class demonstrating the API testing framework."""
+    """Example test class demonstrating the API testing framework.
 
-    @pytest_asyncio.fixture
-    async def api_client(self):
-        """Fixture that provides an API client for tests."""
-        async with APIClient(base_url="https://jsonplaceholder.typicode.com") as client:
-            yield client
+    Uses the session-scoped api_client fixture from conftest.py so all tests
+    share one request context (and its warm connections).
+    """
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="readers")
     async def test_get_all_posts(self, api_client):
         """Test getting all posts - demonstrates basic GET request."""
         response = await api_client.get("/posts")
@@ -30,6 +66,7 @@ class TestJSONPlaceholderAPI:
         await APIValidations.validate_post_list(response, min_count=0)
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="readers")
     async def test_get_single_post(self, api_client):
         """Test getting a specific post - demonstrates parameterized requests."""
         post_id = 1
@@ -37,45 +74,38 @@ class TestJSONPlaceholderAPI:
 
         assert response.is_successful()
 
-        await APIValidations.validate_single_post(response, post_id)
+        _assert_post_shape(await response.json(), expected_id=post_id)
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="writers")
     async def test_create_post(self, api_client):
         """Test creating a new post - demonstrates POST with JSON data."""
-        new_post = {
-            'title': 'Test Framework Post',
-            'body': 'This post was created by our test framework!',
-            'userId': 1
-        }
-
-        response = await api_client.post("/posts", data=new_post)
+        response = await api_client.post("/posts", data=_NEW_POST_BODY,
+                                         headers=_JSON_HEADERS)
 
         assert response.is_successful()
         ResponseValidations.validate_status_code(response, 201)
 
-        await APIValidations.validate_json_contains_fields(response, ['title', 'body', 'userId'])
+        _assert_post_shape(await response.json())
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="writers")
     async def test_update_post(self, api_client):
         """Test updating a post - demonstrates PUT request."""
         post_id = 1
-        updated_data = {
-            'id': post_id,
-            'title': 'Updated Title',
-            'body': 'Updated body content',
-            'userId': 1
-        }
-
-        response = await api_client.put(f"/posts/{post_id}", data=updated_data)
+        response = await api_client.put(f"/posts/{post_id}", data=_UPDATED_POST_BODY,
+                                        headers=_JSON_HEADERS)
 
         assert response.is_successful()
         ResponseValidations.validate_status_code(response, 200)
 
         updated_post = await response.json()
-        assert updated_post['title'] == updated_data['title']
-        assert updated_post['body'] == updated_data['body']
+        _assert_post_shape(updated_post, expected_id=post_id)
+        assert updated_post['title'] == _UPDATED_POST['title']
+        assert updated_post['body'] == _UPDATED_POST['body']
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="writers")
     async def test_delete_post(self, api_client):
         """Test deleting a post - demonstrates DELETE request."""
         post_id = 1
@@ -85,6 +115,7 @@ class TestJSONPlaceholderAPI:
         ResponseValidations.validate_status_code(response, 200)
 
     @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="readers")
     async def test_404_error_handling(self, api_client):
         """Test how we handle client errors - demonstrates error checking."""
         response = await api_client.get("/posts/99999")  # Non-existent post
@@ -94,11 +125,14 @@ class TestJSONPlaceholderAPI:
         assert not response.is_successful()
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize("post_id", [1, 2, 3, 4, 5])
-    async def test_multiple_posts_exist(self, api_client, post_id):
-        """Test that demonstrates parametrized testing - runs for multiple post IDs."""
-        response = await api_client.get(f"/posts/{post_id}")
-
-        assert response.is_successful()
-
-        await APIValidations.validate_single_post(response, post_id)
+    @pytest.mark.xdist_group(name="readers")
+    async def test_multiple_posts_exist(self, api_client):
+        """Test that demonstrates concurrent requests - fetches multiple posts at once."""
+        responses = await asyncio.gather(
+            *(api_client.get(path) for path in _POST_PATHS)
+        )
+        posts = await asyncio.gather(*(response.json() for response in responses))
+
+        for post_id, response, post in zip(_POST_IDS, responses, posts):
+            assert response.is_successful()
+            _assert_post_shape(post, expected_id=post_id)
@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+
+try:
+    # Optional: uvloop's C event loop cuts per-await scheduling overhead
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from framework.api_client import APIClient
+from framework.config import Config
+
+BASE_URL = "https://jsonplaceholder.typicode.com"
+
+
+@pytest.fixture(scope="session")
+def loaded_config():
+    """Parse config.yaml once and share the Config across the session."""
+    return Config(config_file="config.yaml")
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Session-scoped event loop so session-scoped async fixtures can run.
+
+    Runs on uvloop when it's installed; the tests behave identically on the
+    stdlib loop, just with more scheduler overhead per await.
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def playwright_instance():
+    """
+    One Playwright instance for the whole session.
+
+    Starting Playwright spawns a driver subprocess, which dominates setup time
+    for API-only tests - share it instead of starting one per test. The
+    tests/api conftest warms it up front with an autouse fixture; it is not
+    autouse here so 'pytest -m unit' runs never pay the driver spawn.
+    """
+    playwright = await async_playwright().start()
+    yield playwright
+    await playwright.stop()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client(playwright_instance):
+    """
+    One shared APIClient (and request context) for the whole session.
+
+    Keeping a single context alive lets Playwright reuse warm TCP/TLS
+    connections to the API host instead of re-handshaking per test. GET
+    caching is on because JSONPlaceholder is deterministic: several tests
+    read /posts/1, and with the cache they share one network fetch and one
+    parsed body. Writes (post/put/delete) always hit the network. Tests
+    that need a fresh context should use isolated_api_client instead.
+    """
+    async with APIClient(base_url=BASE_URL, playwright=playwright_instance,
+                         cache_gets=True) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def isolated_api_client(playwright_instance):
+    """Per-test APIClient for tests marked @pytest.mark.isolated."""
+    async with APIClient(base_url=BASE_URL, playwright=playwright_instance) as client:
+        yield client
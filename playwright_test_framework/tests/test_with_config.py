@@ -2,88 +2,92 @@
 Example test showing how to use configuration with the API client.
 """
 
+import json
+
 import pytest
 import pytest_asyncio
+from werkzeug.wrappers import Response
+
 from framework.api_client import APIClient
-from framework.config import Config
 
+pytestmark = pytest.mark.integration
 
-class TestAPIWithConfig:
-    """Test class demonstrating configuration usage."""
 
-    @pytest_asyncio.fixture
-    async def api_client_with_config_file(self):
-        """API client loaded from YAML config file."""
-        async with APIClient(config_file="config.yaml") as client:
-            yield client
+@pytest.fixture(scope="session")
+def echo_server(make_httpserver):
+    """
+    Local stand-in for httpbin.org/get: echoes request headers back as JSON.
 
-    @pytest_asyncio.fixture
-    async def api_client_with_manual_config(self):
-        """API client with manually set configuration."""
-        # Instead of passing a config object, we override with constructor params
-        async with APIClient(
-            base_url="https://jsonplaceholder.typicode.com",
-            headers={"Custom-Test": "manual-config"}
-        ) as client:
-            yield client
+    Runs in-process on loopback (pytest-httpserver), so the override test
+    verifies its header round-trip without internet access or the latency
+    and flakiness of a third-party service.
+    """
+    server = make_httpserver
+    server.expect_request("/get").respond_with_handler(
+        lambda request: Response(
+            json.dumps({"headers": dict(request.headers)}),
+            content_type="application/json",
+        )
+    )
+    return server
 
-    @pytest_asyncio.fixture
-    async def api_client_override_config(self):
-        """API client that overrides config with constructor params."""
-        async with APIClient(
-            config_file="config.yaml",
-            base_url="https://httpbin.org",  # Override the config file URL
-            headers={"Custom-Header": "test-value"}  # Add extra header
-        ) as client:
+
+class TestAPIWithConfig:
+    """Test class demonstrating configuration usage."""
+
+    @pytest_asyncio.fixture(scope="session")
+    async def api_client_variant(self, request, loaded_config, playwright_instance,
+                                 echo_server):
+        """
+        Session-scoped client variants, selected by indirect parametrization.
+
+        Tests pick a variant with
+        @pytest.mark.parametrize("api_client_variant", ["<label>"], indirect=True).
+        Each label is constructed once per session and shared by every test
+        that selects it, instead of one client (and context) per fixture.
+        """
+        kwargs_by_label = {
+            # Client driven entirely by the session-loaded YAML config
+            "file": {"config": loaded_config},
+            # Manually set configuration via constructor params
+            "manual": {"base_url": "https://jsonplaceholder.typicode.com",
+                       "headers": {"Custom-Test": "manual-config"}},
+            # Config file with constructor overrides on top; points at the
+            # local echo server instead of the config's URL
+            "override": {"config": loaded_config,
+                         "base_url": echo_server.url_for(""),
+                         "headers": {"Custom-Header": "test-value"}},
+        }
+        async with APIClient(playwright=playwright_instance,
+                             **kwargs_by_label[request.param]) as client:
             yield client
 
     @pytest.mark.asyncio
-    async def test_config_file_loading(self, api_client_with_config_file):
+    @pytest.mark.parametrize("api_client_variant", ["file"], indirect=True)
+    async def test_config_file_loading(self, api_client_variant):
         """Test that config file is loaded properly."""
-        response = await api_client_with_config_file.get("/posts/1")
+        response = await api_client_variant.get("/posts/1")
         assert response.is_successful()
 
         # Verify the User-Agent from config is being used
         # (We can't easily check this without intercepting, but the test passes if config loaded)
 
     @pytest.mark.asyncio
-    async def test_manual_config(self, api_client_with_manual_config):
+    @pytest.mark.parametrize("api_client_variant", ["manual"], indirect=True)
+    async def test_manual_config(self, api_client_variant):
         """Test using manual configuration via constructor."""
-        response = await api_client_with_manual_config.get("/posts/1")
+        response = await api_client_variant.get("/posts/1")
         assert response.is_successful()
 
     @pytest.mark.asyncio
-    async def test_config_override(self, api_client_override_config):
+    @pytest.mark.parametrize("api_client_variant", ["override"], indirect=True)
+    async def test_config_override(self, api_client_variant):
         """Test overriding config with constructor parameters."""
-        # This hits httpbin.org instead of jsonplaceholder due to override
-        response = await api_client_override_config.get("/get")
+        # This hits the local echo server instead of jsonplaceholder due to override
+        response = await api_client_variant.get("/get")
         assert response.is_successful()
 
         data = await response.json()
-        # httpbin.org echoes back headers, so we can verify our custom header
+        # The echo server reflects headers back, so we can verify our custom header
         assert "Custom-Header" in data["headers"]
         assert data["headers"]["Custom-Header"] == "test-value"
-
-
-class TestConfigurationClass:
-    """Test the configuration class itself."""
-
-    def test_default_config(self):
-        """Test default configuration values."""
-        config = Config()
-        assert config.timeout == 30
-        assert config.retry_count == 3
-        assert "User-Agent" in config.default_headers
-
-    def test_config_file_loading(self):
-        """Test loading config from YAML file."""
-        config = Config(config_file="config.yaml")
-        assert config.base_url == "https://jsonplaceholder.typicode.com"
-        assert config.timeout == 30
-
-    def test_config_repr(self):
-        """Test config string representation."""
-        config = Config()
-        repr_str = repr(config)
-        assert "Config(" in repr_str
-        assert "base_url" in repr_str
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Pure-Python unit tests for the configuration class.
+
+Kept apart from the async API tests so a fast tier can run with
+'pytest -m unit' - no network and no Playwright driver involved.
+"""
+
+import pytest
+
+from framework.config import Config
+
+pytestmark = pytest.mark.unit
+
+
+class TestConfigurationClass:
+    """Test the configuration class itself."""
+
+    def test_default_config(self):
+        """Test default configuration values."""
+        config = Config()
+        assert config.timeout == 30
+        assert config.retry_count == 3
+        assert "User-Agent" in config.default_headers
+
+    def test_config_file_loading(self, loaded_config):
+        """Test loading config from YAML file."""
+        assert loaded_config.base_url == "https://jsonplaceholder.typicode.com"
+        assert loaded_config.timeout == 30
+
+    def test_config_repr(self):
+        """Test config string representation."""
+        config = Config()
+        repr_str = repr(config)
+        assert "Config(" in repr_str
+        assert "base_url" in repr_str